@@ -1,6 +1,6 @@
+import re
 import sys
 import time
-import math
 import platform
 import tkinter as tk
 from tkinter import ttk, messagebox
@@ -44,14 +44,17 @@ COUNTDOWN_COLORS = {
 }
 
 # On Windows we'll try a pitched beep; elsewhere we fall back to the window bell.
+# The platform check and import are resolved once here, not on every beep.
+if platform.system() == "Windows":
+    import winsound
+    _beep_impl = lambda: winsound.Beep(1000, 120)  # frequency Hz, duration ms
+else:
+    # Fallback – short bell
+    _beep_impl = lambda: root.bell()
+
 def beep():
     try:
-        if platform.system() == "Windows":
-            import winsound
-            winsound.Beep(1000, 120)  # frequency Hz, duration ms
-        else:
-            # Fallback – short bell
-            root.bell()
+        _beep_impl()
     except Exception:
         try:
             root.bell()
@@ -65,7 +68,15 @@ def try_lcd_font(root):
     """
     Try to find a 'vintage digital/LCD' font if installed; fall back gracefully.
     Good candidates: 'Digital-7 Mono', 'DS-Digital', 'LCDMono2', 'Quartz', etc.
+    The choice is remembered on root so later callers don't probe again.
     """
+    family = getattr(root, "_lcd_family", None)
+    if family is not None:
+        return family
+    root._lcd_family = _pick_lcd_font(root)
+    return root._lcd_family
+
+def _pick_lcd_font(root):
     candidates = [
         "Digital-7 Mono", "Digital-7", "DS-Digital", "LCDMono2", "LCD", "Quartz",
         "Seven Segment", "Segment7", "Let's go Digital", "DSEG7 Classic", "DSEG14 Classic"
@@ -77,53 +88,65 @@ def try_lcd_font(root):
     # Courier New has that monospaced, squared-off vibe as a decent fallback
     return "Courier New"
 
+TICK_INTERVAL = 0.1  # seconds between display refreshes (10 Hz)
+HIDDEN_POLL_MS = 500  # slower tick used while nothing needs the 10 Hz rate
+
+def track_visibility(widget, on_show=None):
+    """
+    Keep widget._visible in step with whether it is actually on screen, i.e.
+    its notebook tab is selected and the window isn't minimized. Map/Unmap of
+    the toplevel and all its descendants pass through the toplevel's bindtag.
+    on_show, if given, is called whenever the widget comes back on screen.
+    """
+    def refresh(_event):
+        was_visible = widget._visible
+        widget._visible = bool(widget.winfo_viewable())
+        if on_show is not None and widget._visible and not was_visible:
+            on_show()
+    widget._visible = True
+    top = widget.winfo_toplevel()
+    top.bind("<Map>", refresh, add="+")
+    top.bind("<Unmap>", refresh, add="+")
+
 def hms_tenths(elapsed_seconds):
     """Return (hours, minutes, seconds, tenths) from float seconds."""
     total_tenths = int(round(elapsed_seconds * 10))
-    hours = total_tenths // (36000)
-    rem = total_tenths % 36000
-    minutes = rem // 600
-    rem = rem % 600
-    seconds = rem // 10
-    tenths = rem % 10
+    hours, rem = divmod(total_tenths, 36000)
+    minutes, rem = divmod(rem, 600)
+    seconds, tenths = divmod(rem, 10)
     return hours, minutes, seconds, tenths
 
+# [[H:]MM:]SS -- groups are (hours, minutes, seconds), missing ones are None
+_TIME_RE = re.compile(r"^\s*(?:(?:(\d+)\s*:\s*)?(\d+)\s*:\s*)?(\d+)\s*$")
+
 def parse_time_entry(s):
     """
-    Parse "H:MM:SS", "MM:SS", "SS", or "H:MM" formats into seconds.
+    Parse "H:MM:SS", "MM:SS", or "SS" formats into seconds.
     Accepts spaces; returns int seconds or raises ValueError.
     """
-    s = s.strip()
-    if not s:
-        raise ValueError("Empty time")
-    parts = [p for p in s.split(":") if p != ""]
-    if len(parts) == 1:
-        # seconds
-        return int(parts[0])
-    elif len(parts) == 2:
-        # MM:SS or H:MM (we'll assume MM:SS, but be generous: if second >= 60, treat as H:MM)
-        a, b = parts
-        a, b = int(a), int(b)
-        if b >= 60:
-            # assume H:MM
-            return a * 3600 + b * 60
-        # assume MM:SS
-        return a * 60 + b
-    elif len(parts) == 3:
-        h, m, s2 = map(int, parts)
-        return h * 3600 + m * 60 + s2
-    else:
-        raise ValueError("Too many ':' parts")
+    m = _TIME_RE.match(s)
+    if not m:
+        raise ValueError(f"Unrecognized time: {s!r}")
+    h, mins, secs = (int(x or 0) for x in m.groups())
+    return h * 3600 + mins * 60 + secs
 
 # =============================================================================
 # Clock Tab
 # =============================================================================
+_PAD2 = [f"{i:02d}" for i in range(62)]  # 0..61 covers tm_sec leap seconds
+
 class ClockTab(ttk.Frame):
     def __init__(self, parent, lcd_family, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
         self["padding"] = 10
         self.configure(style="Panel.TFrame")
 
+        bezel_bg, panel_bg, lcd_fg = SCHEME["bezel"], SCHEME["panel_bg"], SCHEME["lcd_fg"]
+        # Sweep colors are read every tick, so keep them on the instance
+        self._pg = SCHEME["progress_green"]
+        self._py = SCHEME["progress_yellow"]
+        self._pr = SCHEME["progress_red"]
+
         # Clock face container
         outer = ttk.Frame(self, style="Panel.TFrame", padding=12)
         outer.grid(row=0, column=0, sticky="nsew")
@@ -131,74 +154,130 @@ class ClockTab(ttk.Frame):
         outer.rowconfigure(0, weight=1)
 
         # Rectangular bezel
-        bezel = tk.Frame(outer, bg=SCHEME["bezel"], bd=0, highlightthickness=0)
+        bezel = tk.Frame(outer, bg=bezel_bg, bd=0, highlightthickness=0)
         bezel.grid(row=0, column=0, sticky="nsew", pady=(0, 8))
 
         # Bezel ring effect
-        bezel_inner = tk.Frame(bezel, bg=SCHEME["bezel"])
+        bezel_inner = tk.Frame(bezel, bg=bezel_bg)
         bezel_inner.pack(fill="both", expand=True, padx=6, pady=6)
 
         # Inner face (only one)
-        self.face = tk.Frame(bezel_inner, bg=SCHEME["panel_bg"], bd=0, highlightthickness=0)
+        self.face = tk.Frame(bezel_inner, bg=panel_bg, bd=0, highlightthickness=0)
         self.face.pack(fill="both", expand=True)
 
         # Time label
         self.time_var = tk.StringVar(value="")
+        self._last_sec = None  # digits only need re-setting when this changes
         self.time_lbl = tk.Label(
             self.face,
             textvariable=self.time_var,
-            bg=SCHEME["panel_bg"],
-            fg=SCHEME["lcd_fg"],
+            bg=panel_bg,
+            fg=lcd_fg,
             font=(lcd_family, 64, "bold"),
         )
         self.time_lbl.pack(padx=20, pady=(20, 10), fill="x")
 
         # Progress canvas (second-hand sweep)
         self.progress_canvas = tk.Canvas(
-            self.face, height=14, highlightthickness=0, bd=0, bg=SCHEME["panel_bg"]
+            self.face, height=14, highlightthickness=0, bd=0, bg=panel_bg
         )
         self.progress_canvas.pack(fill="x", padx=20, pady=(0, 16))
 
-        # Redraw track on resize so it fits new width
-        self.bind("<Configure>", self._on_resize)
-
-        # Start update loop
-        self._tick()
+        # Track + fill items are created once and just moved/recolored per tick
+        self._bg_id = self.progress_canvas.create_rectangle(0, 0, 1, 1, fill=SCHEME["bg"], width=0)
+        self._fg_id = self.progress_canvas.create_rectangle(0, 0, 1, 1, fill=self._pg, width=0)
+        self._last_color = self._pg
+        self._last_px = -1
+        self._last_frac = 0.0
+        self._cw = self._ch = 0  # laid-out canvas size, applied to track and fill together
+        self._pending_size = None  # latest <Configure> size awaiting the debounced redraw
+        self._pending_resize = None
 
-    def _on_resize(self, _event):
-        # Draw an empty track so the bar fits the new width immediately
-        self.draw_progress_bar(0.0)
+        # Redraw track on resize so it fits new width
+        self.progress_canvas.bind("<Configure>", self._on_resize)
+
+        # Wall-clock offset for the monotonic clock. Between the once-per-second
+        # wall-clock checks in on_tick() the sweep follows the monotonic clock,
+        # so NTP slewing can't nudge it backward mid-second
+        self._wall_offset = time.time() - time.monotonic()
+
+        # Updates are driven by TripleTimerApp's shared ticker via on_tick()
+        track_visibility(self, on_show=self._on_show)
+
+    def _on_show(self):
+        # Hidden ticks skip the digits, so the same tm_sec may now be a different
+        # minute; force the next tick to rewrite them
+        self._last_sec = None
+
+    def _on_resize(self, event):
+        self._pending_size = (event.width, event.height)
+        # A drag fires a storm of <Configure> events; redraw once it settles
+        if self._pending_resize is not None:
+            self.after_cancel(self._pending_resize)
+        self._pending_resize = self.after(16, self._redraw_after_resize)
+
+    def _redraw_after_resize(self):
+        self._pending_resize = None
+        self._cw, self._ch = self._pending_size
+        self.progress_canvas.coords(self._bg_id, 0, 0, self._cw, self._ch)
+        self._last_px = -1  # force the fill to be re-laid out at the new size
+        self.draw_progress_bar(self._last_frac)
 
     def draw_progress_bar(self, frac: float):
-        self.progress_canvas.delete("all")
-        w = self.progress_canvas.winfo_width()
-        h = self.progress_canvas.winfo_height()
+        self._last_frac = frac
+        w, h = self._cw, self._ch
         if w <= 1 or h <= 1:
             return  # not laid out yet
 
         if frac < 0.5:
-            color = SCHEME["progress_green"]
+            color = self._pg
         elif frac < 0.9:
-            color = SCHEME["progress_yellow"]
+            color = self._py
         else:
-            color = SCHEME["progress_red"]
+            color = self._pr
 
-        # background track
-        self.progress_canvas.create_rectangle(0, 0, w, h, fill=SCHEME["bg"], width=0)
-        # filled portion
-        self.progress_canvas.create_rectangle(0, 0, int(w * frac), h, fill=color, width=0)
+        # Nothing visible changed since the last frame
+        new_px = int(w * frac)
+        if new_px == self._last_px and color == self._last_color:
+            return
 
-    def _tick(self):
-        t = time.localtime()
-        self.time_var.set(time.strftime("%H:%M:%S", t))
-        frac = (t.tm_sec + (time.time() % 1.0)) / 60.0
+        # filled portion (the background track only moves on resize)
+        if new_px != self._last_px:
+            self.progress_canvas.coords(self._fg_id, 0, 0, new_px, h)
+            self._last_px = new_px
+        if color != self._last_color:
+            self.progress_canvas.itemconfigure(self._fg_id, fill=color)
+            self._last_color = color
+
+    def on_tick(self):
+        """Advance one tick; returns whether this tab needs the full 10 Hz rate."""
+        if not self._visible:
+            return False
+        # Derive both the second and its fraction from one calibrated monotonic
+        # read so they always agree. Once per second the wall clock is checked;
+        # if it has moved more than 250 ms away (stepped, or slewed that far) we
+        # re-anchor to it, which may jump the sweep in either direction once.
+        now = time.monotonic() + self._wall_offset
+        t = time.localtime(now)
+        if t.tm_sec != self._last_sec:
+            wall = time.time()
+            if abs(wall - now) > 0.25:
+                self._wall_offset += wall - now
+                now = wall
+                t = time.localtime(now)
+            self.time_var.set(f"{_PAD2[t.tm_hour]}:{_PAD2[t.tm_min]}:{_PAD2[t.tm_sec]}")
+            self._last_sec = t.tm_sec
+        frac = (t.tm_sec + (now % 1.0)) / 60.0
         self.draw_progress_bar(frac)
-        self.after(100, self._tick)
+        return True
 
 
 # =============================================================================
 # Stopwatch Tab
 # =============================================================================
+_LAP_FMT = "Lap {n:02d}  |  +{lh:02d}:{lm:02d}:{ls:02d}.{lt}  |  {h:02d}:{m:02d}:{s:02d}.{t}"
+MAX_LAPS_SHOWN = 500  # oldest rows drop off the lap window past this
+
 class StopwatchTab(ttk.Frame):
     def __init__(self, parent, lcd_family, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
@@ -208,7 +287,6 @@ class StopwatchTab(ttk.Frame):
         self.running = False
         self.start_ts = None   # monotonic when started
         self.base_elapsed = 0.0  # accumulated when stopped
-        self.update_job = None
         self.lap_window = None
         self.lap_count = 0
         self.last_lap_elapsed = 0.0
@@ -237,17 +315,24 @@ class StopwatchTab(ttk.Frame):
         for i in range(3):
             self.columnconfigure(i, weight=1)
 
+        track_visibility(self)
+
     def current_elapsed(self):
         if self.running and self.start_ts is not None:
             return self.base_elapsed + (time.monotonic() - self.start_ts)
         return self.base_elapsed
 
-    def update_display(self):
+    def _render(self):
         elapsed = self.current_elapsed()
         h, m, s, t = hms_tenths(elapsed)
         self.var.set(f"{h:02d}:{m:02d}:{s:02d}.{t}")
-        # schedule next update at ~every 100 ms
-        self.update_job = self.after(100, self.update_display)
+
+    def on_tick(self):
+        """Advance one tick; returns whether this tab needs the full 10 Hz rate."""
+        # Elapsed time comes from start_ts, so hidden ticks can simply be skipped
+        if self.running and self._visible:
+            self._render()
+        return self._visible
 
     def toggle(self):
         if not self.running:
@@ -255,8 +340,6 @@ class StopwatchTab(ttk.Frame):
             self.running = True
             self.start_ts = time.monotonic()
             self.start_btn.configure(text="Stop")
-            if self.update_job is None:
-                self.update_display()
         else:
             # stop
             self.running = False
@@ -264,14 +347,8 @@ class StopwatchTab(ttk.Frame):
                 self.base_elapsed += (time.monotonic() - self.start_ts)
             self.start_ts = None
             self.start_btn.configure(text="Start")
-            if self.update_job is not None:
-                self.after_cancel(self.update_job)
-                self.update_job = None
             # ensure display settles on exact value
-            self.update_display()
-            if self.update_job is not None:
-                self.after_cancel(self.update_job)
-                self.update_job = None
+            self._render()
 
     def reset(self):
         self.running = False
@@ -279,9 +356,6 @@ class StopwatchTab(ttk.Frame):
         self.base_elapsed = 0.0
         self.last_lap_elapsed = 0.0
         self.start_btn.configure(text="Start")
-        if self.update_job is not None:
-            self.after_cancel(self.update_job)
-            self.update_job = None
         self.var.set("00:00:00.0")
         # Clear lap list if open
         if self.lap_window and self.lap_window.winfo_exists():
@@ -319,10 +393,12 @@ class StopwatchTab(ttk.Frame):
         self.lap_count += 1
         h, m, s, t = hms_tenths(total)
         lh, lm, ls, lt = hms_tenths(lap_time)
-        self.lap_list.insert(
-            "end",
-            f"Lap {self.lap_count:02d}  |  +{lh:02d}:{lm:02d}:{ls:02d}.{lt}  |  {h:02d}:{m:02d}:{s:02d}.{t}"
-        )
+        self.lap_list.insert("end", _LAP_FMT.format(
+            n=self.lap_count, lh=lh, lm=lm, ls=ls, lt=lt, h=h, m=m, s=s, t=t
+        ))
+        # Keep the list bounded so long sessions don't slow insertion down
+        if self.lap_list.size() > MAX_LAPS_SHOWN:
+            self.lap_list.delete(0)
         # Auto-scroll
         self.lap_list.see("end")
 
@@ -338,11 +414,12 @@ class CountdownTab(ttk.Frame):
         self.total_seconds = 0
         self.remaining = 0
         self.running = False
-        self.job = None
+        self._deadline = None  # monotonic time the countdown hits zero while running
         self.last_whole_sec = None  # to control beeps
 
         # Display
         self.var = tk.StringVar(value="00:00:00")
+        self._last_r = 0  # whole seconds currently shown in self.var
         self.lbl = tk.Label(
             self,
             textvariable=self.var,
@@ -352,6 +429,7 @@ class CountdownTab(ttk.Frame):
             bd=0, highlightthickness=0
         )
         self.lbl.grid(row=0, column=0, columnspan=4, sticky="ew", padx=10, pady=(10, 6))
+        self._cur_fg = SCHEME["lcd_fg"]  # mirrors the label's fg without asking Tk
 
         # Entry row
         ttk.Label(self, text="Time:", style="Muted.TLabel").grid(row=1, column=0, sticky="e", padx=(10, 4))
@@ -373,6 +451,9 @@ class CountdownTab(ttk.Frame):
         self.columnconfigure(2, weight=1)
         self.columnconfigure(3, weight=1)
 
+        # Labels aren't updated while hidden, so catch up as soon as we're shown
+        track_visibility(self, on_show=self.update_display)
+
     def set_time(self):
         try:
             seconds = parse_time_entry(self.entry.get())
@@ -395,31 +476,28 @@ class CountdownTab(ttk.Frame):
         if not self.running:
             self.running = True
             self.start_btn.configure(text="Pause")
-            self._tick()
+            self._deadline = time.monotonic() + self.remaining
+            self.on_tick()
         else:
             self.running = False
+            self.remaining = max(0.0, self._deadline - time.monotonic())
+            self._deadline = None
             self.start_btn.configure(text="Start")
-            if self.job is not None:
-                self.after_cancel(self.job)
-                self.job = None
 
     def reset(self):
         self.running = False
-        if self.job is not None:
-            self.after_cancel(self.job)
-            self.job = None
+        self._deadline = None
         self.remaining = self.total_seconds
         self.last_whole_sec = None
         self.start_btn.configure(text="Start")
         self.update_display(force_color=True)
 
     def update_display(self, force_color=False):
-        # Show as HH:MM:SS
+        # Show as HH:MM:SS (text only changes once per second)
         r = max(0, int(round(self.remaining)))
-        h = r // 3600
-        m = (r % 3600) // 60
-        s = r % 60
-        self.var.set(f"{h:02d}:{m:02d}:{s:02d}")
+        if r != self._last_r:
+            self.var.set(f"{r // 3600:02d}:{(r % 3600) // 60:02d}:{r % 60:02d}")
+            self._last_r = r
 
         # Color by remaining fraction
         if self.total_seconds > 0:
@@ -433,35 +511,39 @@ class CountdownTab(ttk.Frame):
         else:
             color = SCHEME["lcd_fg"]
         # Only update if changed or forced
-        if force_color or self.lbl.cget("fg") != color:
+        if force_color or self._cur_fg != color:
             self.lbl.configure(fg=color)
+            self._cur_fg = color
 
-    def _tick(self):
+    def on_tick(self):
+        """Advance one tick; returns whether this tab needs the full 10 Hz rate."""
         if not self.running:
-            return
-        self.remaining -= 0.1
-        if self.remaining < 0:
-            self.remaining = 0
-
-        # Beep for last 10 whole seconds (once per second)
-        whole = int(math.ceil(self.remaining))
-        if whole <= 10 and whole > 0:
-            if self.last_whole_sec != whole:
-                beep()
+            return self._visible
+        # Measured against the deadline, so late ticks never accumulate error
+        self.remaining = max(0.0, self._deadline - time.monotonic())
+
+        # Beep once per second for the last 10 seconds, as each whole second is
+        # crossed (the ceil edge); it isn't tied to the label's rounding.
+        # rt // 10 + 1 is ceil for anything short of an exact whole second.
+        rt = int(self.remaining * 10)  # remaining tenths, truncated
+        whole = rt // 10 + 1 if rt else 0
+        if 0 < whole <= 10 and whole != self.last_whole_sec:
+            beep()
         self.last_whole_sec = whole
 
-        self.update_display()
-
         if self.remaining <= 0:
             self.running = False
             self.start_btn.configure(text="Start")
-            # Final short triple beep
-            for _ in range(3):
-                beep()
-                self.after(120)
-            return
-
-        self.job = self.after(100, self._tick)
+            # Always settle the label on zero, even if the tab is hidden right now
+            self.update_display()
+            # Final short triple beep, scheduled so the UI isn't held up between beeps
+            for i in range(3):
+                self.after(i * 240, beep)
+        elif self._visible:
+            # Runs at full rate even while hidden so beeps and the alarm stay on
+            # time, but doesn't touch the label nobody can see
+            self.update_display()
+        return True
 
 # =============================================================================
 # Main App
@@ -481,22 +563,31 @@ class TripleTimerApp(tk.Tk):
         except Exception:
             pass
 
-        # Colors & styles
-        self.style.configure("TFrame", background=SCHEME["bg"])
-        self.style.configure("Panel.TFrame", background=SCHEME["panel_bg"])
-        self.style.configure("TLabel", background=SCHEME["bg"], foreground=SCHEME["fg"])
-        self.style.configure("Muted.TLabel", background=SCHEME["bg"], foreground=SCHEME["muted"])
-        self.style.configure("TButton", background=SCHEME["button_bg"], foreground=SCHEME["button_fg"])
-        self.style.map("TButton",
-                       background=[("active", SCHEME["tab_active_bg"])],
-                       foreground=[("active", SCHEME["fg"])])
-
-        # Notebook tabs
-        self.style.configure("TNotebook", background=SCHEME["tab_bg"])
-        self.style.configure("TNotebook.Tab", background=SCHEME["tab_bg"], foreground=SCHEME["tab_fg"])
-        self.style.map("TNotebook.Tab",
-                       background=[("selected", SCHEME["tab_active_bg"])],
-                       foreground=[("selected", SCHEME["tab_fg"])])
+        # Colors & styles (one configure/map call per style name)
+        styles = {
+            "TFrame": {"background": SCHEME["bg"]},
+            "Panel.TFrame": {"background": SCHEME["panel_bg"]},
+            "TLabel": {"background": SCHEME["bg"], "foreground": SCHEME["fg"]},
+            "Muted.TLabel": {"background": SCHEME["bg"], "foreground": SCHEME["muted"]},
+            "TButton": {"background": SCHEME["button_bg"], "foreground": SCHEME["button_fg"]},
+            # Notebook tabs
+            "TNotebook": {"background": SCHEME["tab_bg"]},
+            "TNotebook.Tab": {"background": SCHEME["tab_bg"], "foreground": SCHEME["tab_fg"]},
+        }
+        style_maps = {
+            "TButton": {
+                "background": [("active", SCHEME["tab_active_bg"])],
+                "foreground": [("active", SCHEME["fg"])],
+            },
+            "TNotebook.Tab": {
+                "background": [("selected", SCHEME["tab_active_bg"])],
+                "foreground": [("selected", SCHEME["tab_fg"])],
+            },
+        }
+        for name, kw in styles.items():
+            self.style.configure(name, **kw)
+        for name, kw in style_maps.items():
+            self.style.map(name, **kw)
 
         # Attempt LCD-ish font
         lcd_family = try_lcd_font(self)
@@ -515,11 +606,54 @@ class TripleTimerApp(tk.Tk):
         # App should default to the CLOCK tab on startup
         nb.select(0)
 
+        # One shared 10 Hz ticker drives every tab instead of three after() loops
+        self._slow_poll = False
+        self._next_tick = time.monotonic() + TICK_INTERVAL
+        self._tick_job = self.after(int(TICK_INTERVAL * 1000), self._global_tick)
+        # Get back to 10 Hz right away when un-minimized; Map events of every
+        # widget in the window pass through this binding
+        self.bind("<Map>", self._wake_ticker, add="+")
+
         # Nice keyboard shortcuts
         self.bind_all("<Control-1>", lambda e: nb.select(0))
         self.bind_all("<Control-2>", lambda e: nb.select(1))
         self.bind_all("<Control-3>", lambda e: nb.select(2))
 
+    def _global_tick(self):
+        # Every tab gets the tick, but each on_tick() skips display work while
+        # its tab is hidden; a running countdown still tracks time and beeps.
+        # Each reports whether it needs 10 Hz (on screen, or counting down).
+        wants_fast = [tab.on_tick() for tab in (self.clock_tab, self.stopwatch_tab, self.countdown_tab)]
+
+        self._slow_poll = not any(wants_fast)
+        if self._slow_poll:
+            # Minimized with no countdown running: nothing needs 10 Hz
+            self._next_tick = time.monotonic() + HIDDEN_POLL_MS / 1000
+            self._tick_job = self.after(HIDDEN_POLL_MS, self._global_tick)
+        else:
+            self._tick_job = self.after(self._next_tick_delay(), self._global_tick)
+
+    def _wake_ticker(self, _event=None):
+        """Cut a pending slow poll short and tick again as soon as Tk is idle."""
+        if not self._slow_poll:
+            return
+        self._slow_poll = False
+        self.after_cancel(self._tick_job)
+        self._next_tick = time.monotonic()
+        self._tick_job = self.after_idle(self._global_tick)
+
+    def _next_tick_delay(self):
+        """
+        Advance the ticker's deadline by one interval and return the after() delay in ms.
+        Targets absolute deadlines so callback runtime doesn't accumulate as drift;
+        if we fell badly behind (e.g. system sleep), re-anchor instead of bursting.
+        """
+        now = time.monotonic()
+        self._next_tick += TICK_INTERVAL
+        if self._next_tick < now - TICK_INTERVAL:
+            self._next_tick = now + TICK_INTERVAL
+        return max(0, int((self._next_tick - now) * 1000))
+
 def main():
     global root
     root = TripleTimerApp()